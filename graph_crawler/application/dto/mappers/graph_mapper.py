@@ -165,16 +165,14 @@ class GraphMapper:
             graph_dto.nodes, context=node_context, node_class=node_class
         )
 
-        # Додаємо ноди в граф
-        for node in nodes:
-            graph.add_node(node)
+        # Додаємо ноди в граф одним пакетом
+        graph.add_nodes(nodes)
 
         # Конвертуємо edges через EdgeMapper
         edges = EdgeMapper.to_domain_list(graph_dto.edges, edge_class=edge_class)
 
-        # Додаємо edges в граф
-        for edge in edges:
-            graph.add_edge(edge)
+        # Додаємо edges в граф одним пакетом
+        graph.add_edges(edges)
 
         return graph
 
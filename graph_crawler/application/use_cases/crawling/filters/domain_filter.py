@@ -10,6 +10,7 @@ Alpha 2.0 CHANGES:
 """
 
 import logging
+from typing import Dict, Tuple
 
 from graph_crawler.application.use_cases.crawling.filters.base import BaseURLFilter
 from graph_crawler.application.use_cases.crawling.filters.domain_patterns import (
@@ -20,6 +21,9 @@ from graph_crawler.shared.utils.url_utils import URLUtils
 
 logger = logging.getLogger(__name__)
 
+# Максимальний розмір кешу рішень по доменах (на один фільтр)
+_DOMAIN_CACHE_MAX_SIZE = 4096
+
 
 class DomainFilter(BaseURLFilter):
     """
@@ -35,6 +39,10 @@ class DomainFilter(BaseURLFilter):
         allowed_domains: list - дозволені домени + спеціальні патерни
         blocked_domains: list - заблоковані домени
 
+    Зміни config (allowed_domains, blocked_domains, base_domain) підхоплюються
+    автоматично: is_allowed() порівнює config зі знімком і при розбіжності
+    перепарсює патерни та очищує кеш рішень.
+
     Examples:
         >>> # Wildcard режим
         >>> config = DomainFilterConfig(
@@ -66,6 +74,12 @@ class DomainFilter(BaseURLFilter):
         super().__init__(config)
         self.event_bus = event_bus
 
+        # ОПТИМІЗАЦІЯ: кеш рішень domain -> (allowed, reason).
+        # Один домен перевіряється тисячі разів за краулінг - O(1) замість
+        # проходу по спеціальним патернам та concrete_domains.
+        # Кеш per-instance (lru_cache на методі тримав би self).
+        self._decision_cache: Dict[str, Tuple[bool, str]] = {}
+
         # Парсимо спеціальні патерни
         self._parse_special_patterns()
 
@@ -87,6 +101,9 @@ class DomainFilter(BaseURLFilter):
         """
         special_patterns = AllowedDomains.get_special_patterns()
 
+        # Патерни змінились - попередні рішення недійсні
+        self._decision_cache.clear()
+
         # Ініціалізуємо прапорці
         self.wildcard_mode = False
         self.domain_only = False
@@ -94,6 +111,16 @@ class DomainFilter(BaseURLFilter):
         self.domain_with_sub = False
         self.concrete_domains = set()
 
+        # ОПТИМІЗАЦІЯ: frozenset замість list з конфігу - O(1) membership
+        # для blocked_domains (конфіг лишає list для серіалізації та API)
+        self.blocked_domains = frozenset(self.config.blocked_domains)
+
+        # Знімок конфігу, з яким побудовані патерни та кеш рішень.
+        # Копії list, бо викликачі можуть мутувати списки конфігу на місці
+        self._base_domain_snapshot = self.config.base_domain
+        self._blocked_snapshot = list(self.config.blocked_domains)
+        self._allowed_snapshot = list(self.config.allowed_domains)
+
         # Парсимо кожен домен
         for domain in self.config.allowed_domains:
             if domain == AllowedDomains.ALL.value:  # '*'
@@ -108,6 +135,32 @@ class DomainFilter(BaseURLFilter):
                 # Конкретний домен (не спеціальний патерн)
                 self.concrete_domains.add(domain)
 
+    def _sync_config(self):
+        """
+        Перепарсює патерни, якщо config змінили після попереднього парсингу.
+
+        Викликачі мутують config на місці (append у blocked_domains, нове
+        значення base_domain), тому знімок порівнюється на кожній перевірці.
+        Порівняння list == list виконується в C і для коротких списків дешеве.
+        """
+        config = self.config
+        if (
+            config.blocked_domains != self._blocked_snapshot
+            or config.allowed_domains != self._allowed_snapshot
+            or config.base_domain != self._base_domain_snapshot
+        ):
+            self._parse_special_patterns()
+
+    def refresh(self) -> None:
+        """
+        Примусово перечитує config.
+
+        Заново парсить allowed_domains, перебудовує blocked_domains
+        та очищує кеш рішень по доменам. is_allowed() робить це сам
+        при зміні config, тому виклик потрібен лише для явного скидання.
+        """
+        self._parse_special_patterns()
+
     @property
     def name(self) -> str:
         return "domain"
@@ -143,6 +196,34 @@ class DomainFilter(BaseURLFilter):
 
         return False
 
+    def _has_allowed_parent(self, domain: str) -> bool:
+        """
+        Перевіряє чи domain є субдоменом одного з concrete_domains.
+
+        ОПТИМІЗАЦІЯ: замість перебору всіх concrete_domains (O(N) endswith)
+        перевіряємо кожен батьківський суфікс домену в set - O(кількість міток),
+        незалежно від довжини allowed_domains.
+
+        Приклад: для 'a.jobs.company.com' перевіряються
+        'jobs.company.com', 'company.com', 'com'.
+
+        Args:
+            domain: Домен для перевірки
+
+        Returns:
+            True якщо якийсь батьківський домен є в concrete_domains
+        """
+        concrete = self.concrete_domains
+        if not concrete:
+            return False
+
+        dot = domain.find(".")
+        while dot != -1:
+            if domain[dot + 1 :] in concrete:
+                return True
+            dot = domain.find(".", dot + 1)
+        return False
+
     def is_allowed(self, url: str, source_url: str = None) -> bool:
         """
         Перевіряє чи дозволений домен (Alpha 2.0 з підтримкою спеціальних патернів).
@@ -169,6 +250,8 @@ class DomainFilter(BaseURLFilter):
         if not self.enabled:
             return True
 
+        self._sync_config()
+
         domain = URLUtils.get_domain(url)
         if not domain:
             logger.debug(f"Invalid domain for URL: {url}")
@@ -179,11 +262,35 @@ class DomainFilter(BaseURLFilter):
             logger.debug(f"Wildcard mode: allowing {url}")
             return True
 
+        cached = self._decision_cache.get(domain)
+        if cached is None:
+            cached = self._decide(domain)
+            if len(self._decision_cache) >= _DOMAIN_CACHE_MAX_SIZE:
+                self._decision_cache.clear()
+            self._decision_cache[domain] = cached
+
+        allowed, reason = cached
+        if not allowed:
+            self._publish_filtered_event(url, "domain", reason)
+        return allowed
+
+    def _decide(self, domain: str) -> Tuple[bool, str]:
+        """
+        Обчислює рішення для домену (кроки 2-5 з is_allowed).
+
+        Результат залежить тільки від domain та конфігу, тому кешується
+        в is_allowed().
+
+        Args:
+            domain: Домен для перевірки
+
+        Returns:
+            (allowed, reason) - reason це причина відмови або "" для дозволених
+        """
         #  КРОК 2: Перевіряємо заблоковані домени
-        if domain in self.config.blocked_domains:
+        if domain in self.blocked_domains:
             logger.debug(f"Blocked domain: {domain}")
-            self._publish_filtered_event(url, "domain", "blocked_domain")
-            return False
+            return False, "blocked_domain"
 
         #  КРОК 3: Перевіряємо спеціальні патерни
         base_domain = self.config.base_domain
@@ -192,7 +299,7 @@ class DomainFilter(BaseURLFilter):
         if self.domain_only:
             if domain == base_domain:
                 logger.debug(f"Domain pattern matched: {domain} == {base_domain}")
-                return True
+                return True, ""
 
         # 3.2: Тільки субдомени (без основного домену)
         if self.subdomains_only:
@@ -200,27 +307,24 @@ class DomainFilter(BaseURLFilter):
                 logger.debug(
                     f"Subdomain pattern matched: {domain} is subdomain of {base_domain}"
                 )
-                return True
+                return True, ""
 
         # 3.3: Домен + субдомени (DEFAULT)
         if self.domain_with_sub:
             if self._is_subdomain_of(domain, base_domain):
                 logger.debug(f"Domain+subdomains pattern matched: {domain}")
-                return True
+                return True, ""
 
         #  КРОК 4: Перевіряємо конкретні домени
         if domain in self.concrete_domains:
             logger.debug(f"Concrete domain allowed: {domain}")
-            return True
+            return True, ""
 
         #  КРОК 5: Перевіряємо чи domain є субдоменом будь-якого з concrete_domains
-        if any(
-            self._is_subdomain_of(domain, allowed) for allowed in self.concrete_domains
-        ):
+        if self._has_allowed_parent(domain):
             logger.debug(f"Domain is subdomain of allowed: {domain}")
-            return True
+            return True, ""
 
         # Домен не дозволений
         logger.debug(f"Domain not allowed: {domain}")
-        self._publish_filtered_event(url, "domain", "not_allowed")
-        return False
+        return False, "not_allowed"
@@ -3,10 +3,11 @@
 import logging
 import re
 from typing import List
-from urllib.parse import urlparse
 
 from graph_crawler.application.use_cases.crawling.filters.base import BaseURLFilter
 from graph_crawler.domain.value_objects.models import PathFilterConfig
+from graph_crawler.shared.utils.regex_utils import combine_patterns
+from graph_crawler.shared.utils.url_utils import URLUtils
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,11 @@ class PathFilter(BaseURLFilter):
         self.excluded_patterns = self._compile_patterns(config.excluded_patterns)
         self.included_patterns = self._compile_patterns(config.included_patterns)
 
+        # ОПТИМІЗАЦІЯ: патерни кожного списку об'єднані в один regex - один
+        # прохід по шляху замість циклу search() (None якщо об'єднати не можна)
+        self._excluded_combined = combine_patterns(self.excluded_patterns)
+        self._included_combined = combine_patterns(self.included_patterns)
+
         # EventBus для подій
         self.event_bus = event_bus
 
@@ -69,24 +75,34 @@ class PathFilter(BaseURLFilter):
         if not self.enabled:
             return True
 
-        # Витягуємо шлях з URL
-        parsed = urlparse(url)
-        path = parsed.path
+        # Витягуємо шлях з URL (кешований парсинг, спільний з DomainFilter)
+        path = URLUtils.get_path(url)
 
-        # Перевірка excluded_patterns - якщо збігається, то блокуємо
-        for pattern in self.excluded_patterns:
-            if pattern.search(path):
-                logger.debug(f"Path excluded by pattern {pattern.pattern}: {path}")
-                self._publish_filtered_event(
-                    url, "path", "excluded_pattern", pattern.pattern
-                )
-                return False
+        # Перевірка excluded_patterns - якщо збігається, то блокуємо.
+        # Об'єднаний патерн відсікає типовий випадок (шлях не виключено);
+        # при збігу цикл знаходить конкретний патерн для логу та події
+        excluded_combined = self._excluded_combined
+        if excluded_combined is None or excluded_combined.search(path):
+            for pattern in self.excluded_patterns:
+                if pattern.search(path):
+                    logger.debug(
+                        f"Path excluded by pattern {pattern.pattern}: {path}"
+                    )
+                    self._publish_filtered_event(
+                        url, "path", "excluded_pattern", pattern.pattern
+                    )
+                    return False
 
         # Перевірка included_patterns - якщо задані, то дозволяємо тільки їх
         if self.included_patterns:
-            for pattern in self.included_patterns:
-                if pattern.search(path):
+            included_combined = self._included_combined
+            if included_combined is not None:
+                if included_combined.search(path):
                     return True
+            else:
+                for pattern in self.included_patterns:
+                    if pattern.search(path):
+                        return True
             logger.debug(f"Path not in included patterns: {path}")
             self._publish_filtered_event(url, "path", "not_included", None)
             return False
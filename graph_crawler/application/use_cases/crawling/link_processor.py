@@ -11,7 +11,7 @@ Features:
 import logging
 import re
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from graph_crawler.application.use_cases.crawling.filters.domain_filter import (
     DomainFilter,
@@ -21,12 +21,19 @@ from graph_crawler.application.use_cases.crawling.scheduler import CrawlSchedule
 from graph_crawler.domain.entities.edge import Edge
 from graph_crawler.domain.entities.graph import Graph
 from graph_crawler.domain.entities.node import Node
-from graph_crawler.domain.value_objects.models import EdgeRule, URLRule
+from graph_crawler.domain.value_objects.models import (
+    EdgeCreationStrategy,
+    EdgeRule,
+    URLRule,
+)
 from graph_crawler.extensions.plugins.node import NodePluginManager
 from graph_crawler.shared.utils.url_utils import URLUtils
 
 logger = logging.getLogger(__name__)
 
+# Максимальний розмір кешу url -> URLRule в LinkProcessor
+_RULE_MATCH_CACHE_MAX_SIZE = 8192
+
 
 class LinkProcessor:
     """
@@ -83,15 +90,24 @@ class LinkProcessor:
         # Для стратегії FIRST_ENCOUNTER_ONLY: Set вже створених edges
         self._created_edges: set = set()  # Set[(source_url, target_url)]
 
-        # Компілюємо regex для URLRule
+        # Regex патерни компілюються один раз у самому URLRule
         self._compiled_rules = []
         for rule in self.url_rules:
             try:
-                compiled = re.compile(rule.pattern)
+                compiled = rule.compiled_pattern
                 self._compiled_rules.append((compiled, rule))
             except re.error as e:
                 logger.warning(f"Invalid regex pattern '{rule.pattern}': {e}")
 
+        # ОПТИМІЗАЦІЯ: без правил _match_url_rule() не викликається взагалі
+        self._has_rules = bool(self._compiled_rules)
+        # Кеш url -> URLRule/None для _match_url_rule() (правила незмінні)
+        self._rule_match_cache: Dict[str, Optional[URLRule]] = {}
+        # Об'єднаний regex-префільтр: URL без збігу не перебирає правила по одному
+        self._rules_prefilter = URLRule.build_prefilter(
+            [rule for _, rule in self._compiled_rules]
+        )
+
     def process_links(self, source_node: Node, links: list[str]) -> int:
         """
         Обробляє знайдені посилання з вузла (Alpha 2.0 з URLRule пріоритетом).
@@ -158,23 +174,35 @@ class LinkProcessor:
             return 0
 
         new_nodes_count = 0
+        # ОПТИМІЗАЦІЯ: нові ноди батча додаються в scheduler одним
+        # add_nodes_bulk() замість add_node() на кожне посилання
+        pending: List[Node] = []
 
         for i, link in enumerate(links):
             # Yield control кожні batch_size links
             if i > 0 and i % batch_size == 0:
+                self._flush_pending(pending)
                 await asyncio.sleep(0)  # Yield to event loop
 
             new_nodes_count += self._process_single_link(
-                source_node, link, fetch_response
+                source_node, link, fetch_response, pending=pending
             )
 
+        self._flush_pending(pending)
         return new_nodes_count
 
+    def _flush_pending(self, pending: List[Node]) -> None:
+        """Передає накопичені нові ноди в scheduler одним батчем."""
+        if pending:
+            self.scheduler.add_nodes_bulk(pending)
+            pending.clear()
+
     def _process_single_link(
         self,
         source_node: Node,
         link: str,
         fetch_response: Optional["FetchResponse"] = None,
+        pending: Optional[List[Node]] = None,
     ) -> int:
         """
         Обробляє одне посилання. Винесено для DRY між sync та async версіями.
@@ -186,6 +214,8 @@ class LinkProcessor:
             source_node: Вузол-джерело
             link: URL посилання
             fetch_response: FetchResponse з інформацією про редірект source_node (optional)
+            pending: Якщо передано - нова нода додається сюди для батчевої
+                вставки в scheduler замість негайного add_node()
 
         Returns:
             1 якщо створено нову ноду, 0 інакше
@@ -226,7 +256,10 @@ class LinkProcessor:
 
             # Додаємо в чергу тільки якщо треба сканувати
             if should_scan:
-                self.scheduler.add_node(target_node)
+                if pending is not None:
+                    pending.append(target_node)
+                else:
+                    self.scheduler.add_node(target_node)
 
         # Перевіряємо чи треба створювати edge
         # Порядок: URLRule.create_edge → EdgeRule → Edge Creation Strategies
@@ -246,9 +279,11 @@ class LinkProcessor:
             # Редірект link буде виявлено коли target_node буде завантажуватись
             if fetch_response and fetch_response.is_redirect:
                 # Це інформація про source_node редірект (для діагностики)
-                edge.add_metadata("source_had_redirect", True)
-                edge.add_metadata("source_original_url", fetch_response.url)
-                edge.add_metadata("source_final_url", fetch_response.final_url)
+                edge.update_metadata(
+                    source_had_redirect=True,
+                    source_original_url=fetch_response.url,
+                    source_final_url=fetch_response.final_url,
+                )
 
             self.graph.add_edge(edge)
         else:
@@ -302,7 +337,7 @@ class LinkProcessor:
                 return True, True
 
         #  КРОК 1: Перевіряємо URLRule ПЕРШИМИ (другий пріоритет)
-        matched_rule = self._match_url_rule(url)
+        matched_rule = self._match_url_rule(url) if self._has_rules else None
 
         if matched_rule:
             # URLRule знайдено
@@ -364,11 +399,26 @@ class LinkProcessor:
             >>> if rule:
             >>>     print(f"Matched: {rule.pattern}")
         """
-        for compiled_pattern, rule in self._compiled_rules:
-            if compiled_pattern.search(url):
-                logger.debug(f"URLRule matched: {rule.pattern} for {url}")
-                return rule
-        return None
+        # ОПТИМІЗАЦІЯ: одне посилання перевіряється двічі (scan + edge)
+        # і повторюється на багатьох сторінках (меню, футер) - кешуємо результат
+        # None - теж валідний кешований результат, тому перевірка через in
+        rule_match_cache = self._rule_match_cache
+        if url in rule_match_cache:
+            return rule_match_cache[url]
+
+        matched = None
+        prefilter = self._rules_prefilter
+        if prefilter is None or prefilter.search(url):
+            for compiled_pattern, rule in self._compiled_rules:
+                if compiled_pattern.search(url):
+                    logger.debug(f"URLRule matched: {rule.pattern} for {url}")
+                    matched = rule
+                    break
+
+        if len(rule_match_cache) >= _RULE_MATCH_CACHE_MAX_SIZE:
+            rule_match_cache.clear()
+        rule_match_cache[url] = matched
+        return matched
 
     def _should_create_edge(
         self,
@@ -400,7 +450,7 @@ class LinkProcessor:
             >>>     self.graph.add_edge(edge)
         """
         # КРОК 1: Перевіряємо URLRule.create_edge (НАЙВИЩИЙ ПРІОРИТЕТ)
-        matched_rule = self._match_url_rule(target_url)
+        matched_rule = self._match_url_rule(target_url) if self._has_rules else None
         if matched_rule and matched_rule.create_edge is not None:
             if matched_rule.create_edge is False:
                 logger.debug(
@@ -432,16 +482,18 @@ class LinkProcessor:
                 return True
 
         # КРОК 3: Застосовуємо Edge Creation Strategies
-        from graph_crawler.domain.value_objects.models import EdgeCreationStrategy
+        # ОПТИМІЗАЦІЯ: EdgeCreationStrategy імпортується на рівні модуля,
+        # а не на кожне посилання; стратегія читається в локальну змінну
+        edge_strategy = self.edge_strategy
 
         # ALL: Створювати всі edges (default)
-        if self.edge_strategy == EdgeCreationStrategy.ALL.value:
+        if edge_strategy == EdgeCreationStrategy.ALL.value:
             return True
 
         # NEW_ONLY: Створювати edge ТІЛЬКИ якщо target node щойно створена
         # (її не було в графі до цього виклику process_links)
         # Це означає: кожна нода матиме максимум 1 incoming edge (від того хто її знайшов першим)
-        if self.edge_strategy == EdgeCreationStrategy.NEW_ONLY.value:
+        if edge_strategy == EdgeCreationStrategy.NEW_ONLY.value:
             if not is_new_node:
                 logger.debug(
                     f"Skipping edge by strategy NEW_ONLY: target already existed in graph: "
@@ -450,7 +502,7 @@ class LinkProcessor:
             return is_new_node
 
         # MAX_IN_DEGREE: Не створювати edge якщо target має >= threshold incoming edges
-        if self.edge_strategy == EdgeCreationStrategy.MAX_IN_DEGREE.value:
+        if edge_strategy == EdgeCreationStrategy.MAX_IN_DEGREE.value:
             in_degree = self.graph.get_in_degree(target_node.node_id)
             if in_degree >= self.max_in_degree_threshold:
                 logger.debug(
@@ -461,15 +513,15 @@ class LinkProcessor:
             return True
 
         # SAME_DEPTH_ONLY: Створювати edges тільки на nodes тієї ж глибини
-        if self.edge_strategy == EdgeCreationStrategy.SAME_DEPTH_ONLY.value:
+        if edge_strategy == EdgeCreationStrategy.SAME_DEPTH_ONLY.value:
             return source_node.depth == target_node.depth
 
         # DEEPER_ONLY: Створювати edges тільки на глибші рівні (не назад)
-        if self.edge_strategy == EdgeCreationStrategy.DEEPER_ONLY.value:
+        if edge_strategy == EdgeCreationStrategy.DEEPER_ONLY.value:
             return target_node.depth > source_node.depth
 
         # FIRST_ENCOUNTER_ONLY: Створювати тільки перший edge на кожен target URL
-        if self.edge_strategy == EdgeCreationStrategy.FIRST_ENCOUNTER_ONLY.value:
+        if edge_strategy == EdgeCreationStrategy.FIRST_ENCOUNTER_ONLY.value:
             in_degree = self.graph.get_in_degree(target_node.node_id)
             if in_degree > 0:
                 logger.debug(
@@ -502,21 +554,21 @@ class LinkProcessor:
             target_node: Цільовий вузол
             target_url: URL цільового вузла
         """
-        # Timestamp створення
-        edge.add_metadata("created_at", datetime.utcnow().isoformat())
-
         # Різниця глибини
         depth_diff = target_node.depth - source_node.depth
-        edge.add_metadata("depth_diff", depth_diff)
-
-        # Статус сканування target
-        edge.add_metadata("target_scanned", target_node.scanned)
 
         # Визначаємо типи посилання
         link_types = self._determine_link_types(
             source_node, target_node, target_url, depth_diff
         )
-        edge.add_metadata("link_type", link_types)
+
+        # Всі поля одним update_metadata() замість 4 викликів add_metadata()
+        edge.update_metadata(
+            created_at=datetime.utcnow().isoformat(),  # Timestamp створення
+            depth_diff=depth_diff,
+            target_scanned=target_node.scanned,  # Статус сканування target
+            link_type=link_types,
+        )
 
         logger.debug(f"Edge metadata populated: {link_types}, depth_diff={depth_diff}")
 
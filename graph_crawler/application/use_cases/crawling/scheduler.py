@@ -8,9 +8,10 @@ import heapq
 import logging
 import re
 from collections import deque
-from typing import List, Optional, Set, Union
+from typing import List, Optional, Set, Tuple, Union
 
 from graph_crawler.domain.entities.node import Node
+from graph_crawler.domain.value_objects.models import URLRule
 from graph_crawler.shared.constants import (
     DEFAULT_URL_PRIORITY,
     PRIORITY_MAX,
@@ -91,15 +92,22 @@ class CrawlScheduler:
         # EventBus для подій (Alpha 2.0)
         self.event_bus = event_bus
 
-        # Компілюємо regex патерни для швидкості
+        # Regex патерни компілюються один раз у самому URLRule
         self._compiled_rules = []
         for rule in self.url_rules:
             try:
-                compiled_pattern = re.compile(rule.pattern)
+                compiled_pattern = rule.compiled_pattern
                 self._compiled_rules.append((compiled_pattern, rule))
             except re.error as e:
                 logger.warning(f"Invalid regex pattern '{rule.pattern}': {e}")
 
+        # ОПТИМІЗАЦІЯ: без правил _match_rule() не викликається взагалі
+        self._has_rules = bool(self._compiled_rules)
+        # Об'єднаний regex-префільтр: URL без збігу не перебирає правила по одному
+        self._rules_prefilter = URLRule.build_prefilter(
+            [rule for _, rule in self._compiled_rules]
+        )
+
         logger.debug(f"Scheduler initialized with {len(self.url_rules)} URL rules")
 
     def add_node(self, node: Node) -> bool:
@@ -117,12 +125,79 @@ class CrawlScheduler:
         Returns:
             True якщо вузол додано, False якщо вже був у черзі або відфільтровано
         """
+        prepared = self._prepare_entry(node)
+        if prepared is None:
+            return False
+
+        entry, matched_rule = prepared
+        # Додаємо в priority queue
+        # heapq - мінімальна купа, тому інвертуємо пріоритет (-priority)
+        # Менше число = вища позиція в черзі
+        heapq.heappush(self.queue, entry)
+        self._on_node_queued(node, -entry[0], matched_rule)
+        return True
+
+    def add_nodes_bulk(self, nodes: List[Node]) -> int:
+        """
+        Додає пачку вузлів до черги за один прохід.
+
+        Кожен вузол проходить ті самі перевірки що й в add_node()
+        (seen_urls, url_rules, пріоритет). Різниця лише у вставці в купу:
+        якщо пачка більша за поточну чергу - записи додаються через extend()
+        і купа перебудовується одним heapify() за O(n + k) замість k heappush().
+
+        Args:
+            nodes: Список вузлів для додавання
+
+        Returns:
+            Кількість реально доданих вузлів
+
+        Example:
+            >>> nodes = [Node(url=f"https://example.com/page{i}") for i in range(50)]
+            >>> scheduler.add_nodes_bulk(nodes)
+            50
+        """
+        accepted = []
+        for node in nodes:
+            prepared = self._prepare_entry(node)
+            if prepared is not None:
+                accepted.append(prepared)
+
+        if not accepted:
+            return 0
+
+        if len(accepted) > len(self.queue):
+            self.queue.extend(entry for entry, _ in accepted)
+            heapq.heapify(self.queue)
+        else:
+            for entry, _ in accepted:
+                heapq.heappush(self.queue, entry)
+
+        for entry, matched_rule in accepted:
+            self._on_node_queued(entry[2], -entry[0], matched_rule)
+
+        return len(accepted)
+
+    def _prepare_entry(self, node: Node) -> Optional[Tuple[tuple, Optional[URLRule]]]:
+        """
+        Перевіряє вузол та готує запис для купи (без вставки в чергу).
+
+        Позначає URL як побачений, застосовує правило до ноди та публікує
+        URL_EXCLUDED якщо правило виключає URL.
+
+        Args:
+            node: Вузол для перевірки
+
+        Returns:
+            ((-priority, counter, node), matched_rule) або None якщо вузол
+            вже бачили чи його виключено правилом
+        """
         # Перевіряємо чи вже бачили цей URL
         if node.url in self.seen_urls:
-            return False
+            return None
 
-        # Знаходимо перше правило що матчить URL
-        matched_rule = self._match_rule(node.url)
+        # Знаходимо перше правило що матчить URL (fast path без правил)
+        matched_rule = self._match_rule(node.url) if self._has_rules else None
 
         # Перевіряємо should_scan=False (exclude)
         # URLRule використовує should_scan замість action
@@ -142,19 +217,20 @@ class CrawlScheduler:
                         },
                     )
                 )
-            return False
+            return None
 
         # Застосовуємо правило до ноди (пріоритет, should_scan, should_follow_links)
         priority = self._calculate_priority(node.url, matched_rule, node)
         self._apply_rule_to_node(node, matched_rule)
 
-        # Додаємо в priority queue
-        # heapq - мінімальна купа, тому інвертуємо пріоритет (-priority)
-        # Менше число = вища позиція в черзі
         self.counter += 1
-        heapq.heappush(self.queue, (-priority, self.counter, node))
         self.seen_urls.add(node.url)
+        return (-priority, self.counter, node), matched_rule
 
+    def _on_node_queued(
+        self, node: Node, priority: int, matched_rule: Optional[URLRule]
+    ) -> None:
+        """Логує та публікує події після додавання вузла в чергу (Alpha 2.0)."""
         logger.debug(
             f"Added node: {node.url} (priority={priority}, "
             f"should_scan={node.should_scan}, can_create_edges={node.can_create_edges})"
@@ -187,8 +263,6 @@ class CrawlScheduler:
                     )
                 )
 
-        return True
-
     def get_next(self) -> Optional[Node]:
         """
         Повертає наступний вузол для сканування (з найвищим пріоритетом).
@@ -216,6 +290,10 @@ class CrawlScheduler:
         Returns:
             URLRule або None якщо немає збігів
         """
+        prefilter = self._rules_prefilter
+        if prefilter is not None and not prefilter.search(url):
+            return None
+
         for compiled_pattern, rule in self._compiled_rules:
             if compiled_pattern.search(url):
                 return rule
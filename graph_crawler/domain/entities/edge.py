@@ -1,10 +1,11 @@
 """Базовий клас для ребра графу (посилання між сторінками) - Pydantic модель."""
 
-import uuid
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from graph_crawler.shared.utils.id_generator import generate_id
+
 
 class Edge(BaseModel):
     """
@@ -34,7 +35,7 @@ class Edge(BaseModel):
     # Pydantic fields
     source_node_id: str
     target_node_id: str
-    edge_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    edge_id: str = Field(default_factory=generate_id)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
     # Pydantic configuration
@@ -52,6 +53,24 @@ class Edge(BaseModel):
         """
         self.metadata[key] = value
 
+    def update_metadata(self, values: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        """
+        Додає кілька метаданих за один виклик.
+
+        ОПТИМІЗАЦІЯ: один dict.update() замість N викликів add_metadata().
+
+        Args:
+            values: Словник метаданих
+            **kwargs: Додаткові метадані як keyword-аргументи
+
+        Example:
+            >>> edge.update_metadata({"anchor_text": "Click here"}, rel="nofollow")
+        """
+        if values:
+            self.metadata.update(values)
+        if kwargs:
+            self.metadata.update(kwargs)
+
     def get_meta_value(self, key: str, default: Any = None) -> Any:
         """
         Отримати значення з metadata за ключем (Law of Demeter wrapper).
@@ -91,10 +110,12 @@ class Edge(BaseModel):
             >>> edge.get_original_url()
             'https://example.com/old'
         """
-        self.add_metadata("was_redirect", True)
-        self.add_metadata("original_url", original_url)
-        self.add_metadata("final_url", final_url)
-        self.add_metadata("redirect_chain", redirect_chain)
+        self.update_metadata(
+            was_redirect=True,
+            original_url=original_url,
+            final_url=final_url,
+            redirect_chain=redirect_chain,
+        )
 
     def is_redirect(self) -> bool:
         """
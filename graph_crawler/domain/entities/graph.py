@@ -7,7 +7,7 @@
 """
 
 import logging
-from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from graph_crawler.domain.entities.edge import Edge
 from graph_crawler.domain.entities.edge_analysis import EdgeAnalysis
@@ -53,6 +53,19 @@ class Graph:
             >>> g3 = g1 + g2  # Використає 'merge' стратегію
     """
 
+    # ОПТИМІЗАЦІЯ: фіксований набір атрибутів без __dict__ на інстанс
+    # (__weakref__ лишається для WeakValueDictionary/weakref.ref на граф)
+    __slots__ = (
+        "_nodes",
+        "_edges",
+        "_url_to_node",
+        "_default_merge_strategy",
+        "_edge_index",
+        "_adjacency_list_out",
+        "_adjacency_list_in",
+        "__weakref__",
+    )
+
     def __init__(self, default_merge_strategy: Optional[str] = None):
         """
         Ініціалізує новий граф.
@@ -170,6 +183,51 @@ class Graph:
         self._url_to_node[node.url] = node
         return node
 
+    def add_nodes(self, nodes: Iterable[Node], overwrite: bool = False) -> List[Node]:
+        """
+        Додає пакет вузлів до графу.
+
+        Семантика та сама що й у послідовних викликах add_node(): для дубліката
+        URL повертається існуючий вузол (або він перезаписується при overwrite).
+
+        ОПТИМІЗАЦІЯ: словники прив'язані до локальних змінних, нові вузли
+        додаються в індекси одним update() замість dict.__setitem__ на кожен.
+
+        Args:
+            nodes: Вузли для додавання
+            overwrite: Якщо True - перезаписує існуючі вузли з тим самим URL
+
+        Returns:
+            Список доданих або існуючих вузлів (в порядку вхідних)
+        """
+        url_to_node = self._url_to_node
+        nodes_by_id = self._nodes
+        new_by_url: Dict[str, Node] = {}
+        result: List[Node] = []
+        append = result.append
+
+        for node in nodes:
+            url = node.url
+            existing = new_by_url.get(url) or url_to_node.get(url)
+            if existing is None:
+                new_by_url[url] = node
+                append(node)
+            elif overwrite:
+                logger.debug(f"Node overwritten: {url}")
+                if url in new_by_url:
+                    new_by_url[url] = node
+                else:
+                    nodes_by_id[existing.node_id] = node
+                    url_to_node[url] = node
+                append(node)
+            else:
+                append(existing)
+
+        if new_by_url:
+            url_to_node.update(new_by_url)
+            nodes_by_id.update({node.node_id: node for node in new_by_url.values()})
+        return result
+
     def get_node_by_url(self, url: str) -> Optional[Node]:
         """Отримує вузол за URL."""
         return self._url_to_node.get(url)
@@ -196,6 +254,33 @@ class Graph:
         self._adjacency_list_in[edge.target_node_id].add(edge.source_node_id)
         return edge
 
+    def add_edges(self, edges: Iterable[Edge]) -> List[Edge]:
+        """
+        Додає пакет ребер до графу.
+
+        ОПТИМІЗАЦІЯ: список ребер розширюється одним extend(), edge index -
+        одним update(), adjacency lists оновлюються в локальному циклі.
+
+        Args:
+            edges: Ребра для додавання
+
+        Returns:
+            Список доданих ребер
+        """
+        edges = list(edges)
+        if not edges:
+            return edges
+
+        self._edges.extend(edges)
+        pairs = [(edge.source_node_id, edge.target_node_id) for edge in edges]
+        self._edge_index.update(pairs)
+        adjacency_out = self._adjacency_list_out
+        adjacency_in = self._adjacency_list_in
+        for source_id, target_id in pairs:
+            adjacency_out[source_id].add(target_id)
+            adjacency_in[target_id].add(source_id)
+        return edges
+
     def has_edge(self, source_node_id: str, target_node_id: str) -> bool:
         """
         Перевіряє наявність ребра за O(1) замість O(n).
@@ -235,29 +320,28 @@ class Graph:
         del self._nodes[node_id]
         del self._url_to_node[node.url]
 
-        # Видаляємо ребра та оновлюємо edge_index + adjacency lists одночасно
-        edges_to_keep = []
-        for edge in self._edges:
-            if edge.source_node_id == node_id or edge.target_node_id == node_id:
-                # Видаляємо з edge_index
-                self._edge_index.discard((edge.source_node_id, edge.target_node_id))
-                # Видаляємо з adjacency lists
-                self._adjacency_list_out[edge.source_node_id].discard(
-                    edge.target_node_id
-                )
-                self._adjacency_list_in[edge.target_node_id].discard(
-                    edge.source_node_id
-                )
-            else:
-                edges_to_keep.append(edge)
-
-        self._edges = edges_to_keep
-
-        # Видаляємо порожні записи з adjacency lists
-        if node_id in self._adjacency_list_out:
-            del self._adjacency_list_out[node_id]
-        if node_id in self._adjacency_list_in:
-            del self._adjacency_list_in[node_id]
+        # ОПТИМІЗАЦІЯ: сусіди вузла беруться з adjacency lists - O(deg(v))
+        # замість проходу по всіх ребрах для оновлення індексів
+        targets = self._adjacency_list_out.pop(node_id, None) or set()
+        sources = self._adjacency_list_in.pop(node_id, None) or set()
+
+        for target_id in targets:
+            self._edge_index.discard((node_id, target_id))
+            if target_id != node_id:
+                self._adjacency_list_in[target_id].discard(node_id)
+        for source_id in sources:
+            self._edge_index.discard((source_id, node_id))
+            if source_id != node_id:
+                self._adjacency_list_out[source_id].discard(node_id)
+
+        # Список ребер перебудовується тільки якщо у вузла були ребра.
+        # Ізольований вузол видаляється за O(1).
+        if targets or sources:
+            self._edges = [
+                edge
+                for edge in self._edges
+                if edge.source_node_id != node_id and edge.target_node_id != node_id
+            ]
 
         logger.debug(f"Node removed: {node.url} (id={node_id})")
         return True
@@ -838,10 +922,16 @@ class Graph:
             Новий граф з копіями вузлів та ребер
         """
         result = Graph()
-        for node in self._nodes.values():
-            result.add_node(node)
-        for edge in self._edges:
-            result.add_edge(edge)
+        # ОПТИМІЗАЦІЯ: індекси копіюються C-level конструкторами dict/list/set
+        # замість повторного add_node()/add_edge() на кожен елемент
+        result._nodes = dict(self._nodes)
+        result._edges = list(self._edges)
+        result._url_to_node = dict(self._url_to_node)
+        result._edge_index = set(self._edge_index)
+        for node_id, targets in self._adjacency_list_out.items():
+            result._adjacency_list_out[node_id] = set(targets)
+        for node_id, sources in self._adjacency_list_in.items():
+            result._adjacency_list_in[node_id] = set(sources)
         return result
 
     # ==================== Edge Analysis Methods ====================
@@ -113,20 +113,16 @@ class GraphOperations:
 
         result = Graph()
 
-        # Додаємо всі вузли з першого графу
-        for node in g1._nodes.values():
-            result.add_node(node)
+        # Додаємо всі вузли з першого графу одним пакетом
+        result.add_nodes(g1._nodes.values())
 
         # НЕ додаємо ребра з g1 зараз - додамо пізніше з правильними node_id
         # (бо node_id можуть змінитись при merge)
 
         # Мапа для відстеження змін node_id після merge
         # Зберігаємо мапінг для ОБОХ графів: old_node_id -> new_node_id
-        node_id_mapping = {}
-
         # Ініціалізуємо мапінг для g1 (поки що ідентичний)
-        for node in g1._nodes.values():
-            node_id_mapping[node.node_id] = node.node_id
+        node_id_mapping = {node_id: node_id for node_id in g1._nodes}
 
         # Обробляємо вузли з другого графу
         conflicts_count = 0
@@ -245,24 +241,24 @@ class GraphOperations:
             raise TypeError(f"g2 must be Graph instance, got {type(g2).__name__}")
 
         result = Graph()
-        # Використовуємо url_to_node для O(1) lookup
-        other_urls = set(g2._url_to_node.keys())
+        # ОПТИМІЗАЦІЯ: url_to_node вже є dict з O(1) lookup - без копії в set
+        other_urls = g2._url_to_node
 
         # Додаємо тільки вузли з першого графу, яких немає в другому (за URL)
-        for node in g1._nodes.values():
-            if node.url not in other_urls:
-                result.add_node(node)
+        result.add_nodes(
+            node for url, node in g1._url_to_node.items() if url not in other_urls
+        )
 
-        # Створюємо set node_id результату для перевірки ребер
-        result_node_ids = set(result._nodes.keys())
+        # keys() view - set-like, копія не потрібна
+        result_node_ids = result._nodes.keys()
 
         # Додаємо ребра де обидва кінці є в результаті
-        for edge in g1._edges:
-            if (
-                edge.source_node_id in result_node_ids
-                and edge.target_node_id in result_node_ids
-            ):
-                result.add_edge(edge)
+        result.add_edges(
+            edge
+            for edge in g1._edges
+            if edge.source_node_id in result_node_ids
+            and edge.target_node_id in result_node_ids
+        )
 
         logger.debug(
             f"Difference completed: g1={len(g1.nodes)} - g2={len(g2.nodes)} = {len(result.nodes)} nodes, "
@@ -302,35 +298,32 @@ class GraphOperations:
 
         result = Graph()
 
-        # Використовуємо set intersection для знаходження спільних URL
-        g1_urls = set(g1._url_to_node.keys())
-        g2_urls = set(g2._url_to_node.keys())
-        common_urls = g1_urls & g2_urls  # Set intersection - O(min(len(g1), len(g2)))
+        # ОПТИМІЗАЦІЯ: перетин keys() views виконується в C без проміжних set-копій
+        g1_url_to_node = g1._url_to_node
+        common_urls = g1_url_to_node.keys() & g2._url_to_node.keys()
 
         logger.debug(
-            f"Intersection: g1={len(g1_urls)} urls, g2={len(g2_urls)} urls, common={len(common_urls)}"
+            f"Intersection: g1={len(g1_url_to_node)} urls, g2={len(g2._url_to_node)} urls, "
+            f"common={len(common_urls)}"
         )
 
         # Додаємо тільки спільні вузли (беремо з g1)
-        for url in common_urls:
-            node = g1.get_node_by_url(url)
-            if node:
-                result.add_node(node)
+        result.add_nodes(g1_url_to_node[url] for url in common_urls)
 
         # Створюємо мапу URL -> node_id для результату
         # Це потрібно для перетворення ребер з g2 (де node_id інші)
         result_url_to_id = {node.url: node.node_id for node in result._nodes.values()}
-        result_node_ids = set(result._nodes.keys())
+        result_node_ids = result._nodes.keys()
 
         # Додаємо ребра з g1 (node_id співпадають)
-        edges_from_g1 = 0
-        for edge in g1._edges:
-            if (
-                edge.source_node_id in result_node_ids
+        edges_from_g1 = len(
+            result.add_edges(
+                edge
+                for edge in g1._edges
+                if edge.source_node_id in result_node_ids
                 and edge.target_node_id in result_node_ids
-            ):
-                result.add_edge(edge)
-                edges_from_g1 += 1
+            )
+        )
 
         # Додаємо ребра з g2 (потрібно перетворити node_id через URL)
         # Створюємо мапу g2_node_id -> URL для швидкого lookup
@@ -400,7 +393,8 @@ class GraphOperations:
         Returns:
             True якщо графи рівні
         """
-        return set(g1._url_to_node.keys()) == set(g2._url_to_node.keys())
+        # keys() views порівнюються як множини без копіювання
+        return g1._url_to_node.keys() == g2._url_to_node.keys()
 
     @staticmethod
     def is_subgraph(g1: "Graph", g2: "Graph", strict: bool = False) -> bool:
@@ -415,8 +409,8 @@ class GraphOperations:
         Returns:
             True якщо g1 є підграфом g2
         """
-        g1_urls = set(g1._url_to_node.keys())
-        g2_urls = set(g2._url_to_node.keys())
+        g1_urls = g1._url_to_node.keys()
+        g2_urls = g2._url_to_node.keys()
 
         if strict:
             return g1_urls < g2_urls  # Строгий підграф
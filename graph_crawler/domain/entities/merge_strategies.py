@@ -214,7 +214,7 @@ class NodeMerger:
         # lifecycle_stage: беремо більш просунутий
         from graph_crawler.domain.entities.lifecycle import NodeLifecycle
 
-        if node2.lifecycle_stage == NodeLifecycle.HTML_STAGE:
+        if node2.lifecycle_stage is NodeLifecycle.HTML_STAGE:
             merged.lifecycle_stage = NodeLifecycle.HTML_STAGE
 
         logger.debug(
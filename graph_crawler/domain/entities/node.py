@@ -3,7 +3,6 @@
 import asyncio
 import logging
 import os
-import uuid
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Tuple
@@ -21,12 +20,20 @@ from graph_crawler.domain.value_objects.lifecycle import (
     NodeLifecycleError,
 )
 from graph_crawler.infrastructure.adapters.base import BaseTreeAdapter
+from graph_crawler.shared.exceptions import InvalidURLError
+from graph_crawler.shared.utils.id_generator import generate_id
+from graph_crawler.shared.utils.url_utils import URLUtils
 
 if TYPE_CHECKING:
     from graph_crawler.extensions.plugins.node import NodePluginContext, NodePluginType
 
 logger = logging.getLogger(__name__)
 
+# ============ URL VALIDATION ============
+# ОПТИМІЗАЦІЯ: валідатор url викликається на кожну ноду - схеми підготовлені
+# один раз на модуль, а домен береться з кешованого URLUtils.get_domain()
+_URL_SCHEMES = ("http://", "https://")
+
 # ============ THREAD POOL для HTML PARSING ============
 # Використовуємо ThreadPoolExecutor для переносу блокуючих операцій парсингу HTML
 # з main event loop в окремі потоки
@@ -164,7 +171,7 @@ class Node(BaseModel):
     # ============ PYDANTIC FIELDS ============
     # Базові параметри (ЕТАП 1: URL_STAGE)
     url: str
-    node_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    node_id: str = Field(default_factory=generate_id)
     depth: int = Field(default=0, ge=0)
     should_scan: bool = True
     can_create_edges: bool = True
@@ -205,18 +212,15 @@ class Node(BaseModel):
     @classmethod
     def validate_url(cls, v: str) -> str:
         """Валідація URL."""
-        from urllib.parse import urlparse
-
-        from graph_crawler.shared.exceptions import InvalidURLError
-
         if not v:
             raise InvalidURLError("URL cannot be empty")
 
-        if not v.startswith(("http://", "https://")):
+        # startswith з tuple - C-level перевірка без regex
+        if not v.startswith(_URL_SCHEMES):
             raise InvalidURLError(f"URL must start with http:// or https://, got: {v}")
 
-        parsed = urlparse(v)
-        if not parsed.netloc:
+        # Кешований urlparse через URLUtils - та сама семантика netloc, що й раніше
+        if not URLUtils.get_domain(v):
             raise InvalidURLError(f"URL must have a valid domain: {v}")
 
         return v
@@ -279,7 +283,7 @@ class Node(BaseModel):
             NodeLifecycleError: Якщо нода вже просканована
         """
         # Перевірка lifecycle
-        if self.lifecycle_stage == NodeLifecycle.HTML_STAGE:
+        if self.lifecycle_stage is NodeLifecycle.HTML_STAGE:
             logger.warning(f"Node already processed: {self.url}")
             return []
 
@@ -480,7 +484,7 @@ class Node(BaseModel):
         import re
 
         # Перевірка lifecycle - можна викликати тільки після process_html
-        if self.lifecycle_stage != NodeLifecycle.HTML_STAGE:
+        if self.lifecycle_stage is not NodeLifecycle.HTML_STAGE:
             raise NodeLifecycleError(
                 f"Cannot compute content_hash at {self.lifecycle_stage.value}. "
                 f"Call process_html() first (must be at HTML_STAGE)."
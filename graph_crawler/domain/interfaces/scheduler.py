@@ -10,6 +10,10 @@ class IScheduler(Protocol):
         """Додає ноду в чергу."""
         ...
 
+    def add_nodes_bulk(self, nodes) -> int:
+        """Додає пачку нод в чергу, повертає кількість доданих."""
+        ...
+
     def get_next(self):
         """Отримує наступну ноду для сканування."""
         ...
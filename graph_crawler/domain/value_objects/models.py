@@ -9,7 +9,16 @@ import warnings
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+from graph_crawler.shared.utils.regex_utils import combine_patterns
 
 # ==================== EDGE CREATION STRATEGIES ====================
 
@@ -468,6 +477,68 @@ class URLRule(BaseModel):
         ),
     )
 
+    # ОПТИМІЗАЦІЯ: скомпільований regex зберігається в самому правилі,
+    # тому scheduler та LinkProcessor не компілюють один патерн двічі
+    _compiled_pattern: Optional[re.Pattern] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Компілює pattern одразу при створенні правила."""
+        try:
+            self._compiled_pattern = re.compile(self.pattern)
+        except re.error:
+            # Невалідний патерн - помилка буде піднята при доступі до
+            # compiled_pattern (scheduler логує її та пропускає правило)
+            self._compiled_pattern = None
+
+    @property
+    def compiled_pattern(self) -> re.Pattern:
+        """
+        Скомпільований regex для pattern.
+
+        Raises:
+            re.error: Якщо pattern не є валідним regex
+        """
+        compiled = self._compiled_pattern
+        # model_copy(update={'pattern': ...}) копіює і _compiled_pattern -
+        # тому перевіряємо що кеш відповідає поточному pattern
+        if compiled is None or compiled.pattern != self.pattern:
+            compiled = re.compile(self.pattern)
+            self._compiled_pattern = compiled
+        return compiled
+
+    @staticmethod
+    def build_prefilter(rules: "list[URLRule]") -> Optional[re.Pattern]:
+        """
+        Будує один об'єднаний regex (p1|p2|...) для швидкої відсіки URL.
+
+        Якщо об'єднаний патерн не знаходить збігу - жодне правило не
+        матчить URL, і перебір правил можна пропустити. При збігу все одно
+        потрібен перебір, бо порядок правил визначає яке з них перше.
+
+        Повертає None коли префільтр не має сенсу або небезпечний:
+        менше двох правил, невалідні патерни, back-references (\\1, (?P=name))
+        чи inline-флаги (які в об'єднаному патерні змінили б семантику).
+
+        Args:
+            rules: Список URLRule
+
+        Returns:
+            Скомпільований об'єднаний патерн або None
+
+        Example:
+            >>> prefilter = URLRule.build_prefilter(rules)
+            >>> if prefilter is not None and not prefilter.search(url):
+            ...     return None  # жодне правило не матчить
+        """
+        if len(rules) < 2:
+            return None
+
+        try:
+            compiled = [rule.compiled_pattern for rule in rules]
+        except re.error:
+            return None
+        return combine_patterns(compiled)
+
     def apply_to_node(self, node: "Node") -> None:
         """
         Застосовує правило до ноди (Tell, Don't Ask принцип).
@@ -492,7 +563,9 @@ class URLRule(BaseModel):
         if self.should_follow_links is not None:
             node.can_create_edges = self.should_follow_links
 
-    model_config = ConfigDict(frozen=False)
+    # Правило незмінне після створення: hashable (можна класти в set/dict
+    # та використовувати як ключ кешу), а compiled_pattern завжди актуальний
+    model_config = ConfigDict(frozen=True)
 
     def __repr__(self):
         parts = [f"pattern={self.pattern!r}"]
@@ -211,14 +211,14 @@ class JSONStorage(BaseStorage):
             if AIOFILES_AVAILABLE:
                 async with aiofiles.open(self.graph_file, "r", encoding="utf-8") as f:
                     content = await f.read()
-                data = json.loads(content)
             else:
                 # Fallback до sync якщо aiofiles не встановлено
                 with open(self.graph_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                    content = f.read()
 
-            # Десеріалізуємо GraphDTO через Pydantic model_validate()
-            graph_dto = GraphDTO.model_validate(data)
+            # ОПТИМІЗАЦІЯ: model_validate_json парсить JSON в pydantic-core
+            # напряму в GraphDTO - без проміжного дерева dict/list з json.loads()
+            graph_dto = GraphDTO.model_validate_json(content)
 
             duration = time.time() - start_time
 
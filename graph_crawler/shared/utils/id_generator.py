@@ -0,0 +1,57 @@
+"""Швидка генерація унікальних ID для вузлів та ребер графу.
+
+uuid.uuid4() на кожен Node/Edge читає 16 байт з os.urandom (syscall) і
+форматує новий UUID. При краулінгу на 100k+ сторінок це помітна частка часу
+add_node/add_edge.
+
+ОПТИМІЗАЦІЯ: випадковий суфікс генерується один раз на процес, а перед
+ним ставиться лічильник. Результат має той самий формат що й UUID
+(36 символів, 8-4-4-4-12 hex), тому серіалізація, DTO та storage не змінюються.
+
+Лічильник стоїть на початку, бо ID скорочуються до перших символів для
+відображення (Edge.__repr__, логи, DOT-експорт) - так скорочені ID різні.
+
+Унікальність:
+- в межах процесу - монотонний лічильник
+- між процесами (Celery workers, multiprocessing) - різні випадкові суфікси
+- після fork() - дочірній процес отримує новий суфікс
+
+Example:
+    >>> from graph_crawler.shared.utils.id_generator import generate_id
+    >>> generate_id()
+    '00000000-9a4d-4c7e-b1f0-3f2b8c1e5d7a'
+    >>> generate_id()
+    '00000001-9a4d-4c7e-b1f0-3f2b8c1e5d7a'
+"""
+
+import itertools
+import os
+import uuid
+
+_suffix: str = ""
+_counter = itertools.count()
+
+
+def _reset() -> None:
+    """Генерує новий випадковий суфікс та скидає лічильник."""
+    global _suffix, _counter
+    hex_ = uuid.uuid4().hex
+    _suffix = f"-{hex_[:4]}-{hex_[4:8]}-{hex_[8:12]}-{hex_[12:24]}"
+    _counter = itertools.count()
+
+
+def generate_id() -> str:
+    """
+    Повертає унікальний ID у форматі UUID без syscall на кожен виклик.
+
+    Returns:
+        Рядок з 36 символів (8-4-4-4-12 hex)
+    """
+    return f"{next(_counter):08x}{_suffix}"
+
+
+_reset()
+
+# Після fork() дочірній процес не повинен продовжувати лічильник батька
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset)
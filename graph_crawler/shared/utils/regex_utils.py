@@ -0,0 +1,56 @@
+"""Утиліти для роботи з наборами regex патернів.
+
+ОПТИМІЗАЦІЯ: N патернів, які перевіряються на кожен URL, можна об'єднати
+в одну альтернацію (?:p1)|(?:p2)|... - движок re робить один прохід по рядку
+замість N викликів search() з Python-циклу.
+
+Example:
+    >>> from graph_crawler.shared.utils.regex_utils import combine_patterns
+    >>> combined = combine_patterns([re.compile(r"/admin/"), re.compile(r"/api/")])
+    >>> bool(combined.search("/api/v1"))
+    True
+"""
+
+import re
+from typing import Iterable, Optional
+
+# Back-references (\1, (?P=name)) та умовні посилання на групи ((?(1)...),
+# (?(name)...)) ламають нумерацію груп в об'єднаному патерні
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+_DEFAULT_FLAGS = re.compile("").flags
+
+
+def combine_patterns(patterns: Iterable[re.Pattern]) -> Optional[re.Pattern]:
+    """
+    Об'єднує скомпільовані патерни в один regex (p1|p2|...).
+
+    Об'єднаний патерн знаходить збіг тоді і тільки тоді, коли його знаходить
+    хоча б один з вхідних патернів (для search()).
+
+    Повертає None коли об'єднання не має сенсу або небезпечне:
+    менше двох патернів, back-references (включно з умовними (?(1)...)) чи
+    не-дефолтні флаги (inline-флаги в об'єднаному патерні змінили б
+    семантику інших частин).
+
+    Args:
+        patterns: Скомпільовані патерни
+
+    Returns:
+        Скомпільований об'єднаний патерн або None
+    """
+    parts = []
+    for compiled in patterns:
+        if compiled.flags != _DEFAULT_FLAGS or _BACKREFERENCE_RE.search(
+            compiled.pattern
+        ):
+            return None
+        parts.append(f"(?:{compiled.pattern})")
+
+    if len(parts) < 2:
+        return None
+
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
@@ -95,6 +95,16 @@ class URLUtils:
         _, netloc, _, _, _, _ = _parse_url_cached(url)
         return netloc if netloc else None
 
+    @staticmethod
+    def get_path(url: str) -> str:
+        """
+        Витягує шлях з URL.
+
+        Використовує той самий кеш _parse_url_cached що й get_domain(),
+        тому DomainFilter та PathFilter не парсять один URL двічі.
+        """
+        return _parse_url_cached(url)[2]
+
     @staticmethod
     @lru_cache(maxsize=50000)
     def get_root_domain(url: str) -> Optional[str]: